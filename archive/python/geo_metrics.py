@@ -1,6 +1,47 @@
 import numpy as np
 import math
 import re
+import threading
+from bisect import bisect_right
+
+# Cümle sınırları için derlenmiş desen (her çağrıda yeniden derlenmesin)
+_SENTENCE_SPLIT_RE = re.compile('[.!?]')
+
+# calculate_metrics önbelleği sınırları: kayıt sayısı ve önbellekte tutulan
+# toplam metin uzunluğu (karakter), bellek kullanımını sınırlamak için
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_MAX_CHARS = 1_000_000
+
+# Bu uzunluktan kısa dizilerde Numba çekirdeği kullanılmaz (derleme ve
+# import maliyeti ancak çok büyük girdilerde geçici dizi tasarrufuyla karşılanır)
+_KERNEL_MIN_LENGTH = 100_000
+
+def _pam_loop(words, positions, inv_lambda):
+    # sum(w * exp(-p / lambda)) döngüsü; numba varsa derlenerek kullanılır
+    total = 0.0
+    for i in range(words.shape[0]):
+        total += words[i] * math.exp(-positions[i] * inv_lambda)
+    return total
+
+_pam_kernel = None
+_pam_kernel_loaded = False
+
+def _get_pam_kernel():
+    """
+    Numba ile derlenmiş çekirdeği ilk ihtiyaçta yükler.
+    
+    Returns:
+        callable: Derlenmiş fonksiyon; numba yüklü değilse None
+    """
+    global _pam_kernel, _pam_kernel_loaded
+    if not _pam_kernel_loaded:
+        _pam_kernel_loaded = True
+        try:
+            from numba import njit
+        except ImportError:  # numba opsiyonel; yoksa NumPy yolu kullanılır
+            return None
+        _pam_kernel = njit(cache=True)(_pam_loop)
+    return _pam_kernel
 
 class GEOMetrics:
     def __init__(self, lambda_decay=10):
@@ -11,6 +52,18 @@ class GEOMetrics:
             lambda_decay (int): Konum ağırlıklı metrik için bozulma faktörü
         """
         self.lambda_decay = lambda_decay
+        self._cache = {}
+        self._cache_chars = 0
+        # Aynı örnek birden çok iş parçacığından kullanılabilir
+        self._cache_lock = threading.Lock()
+    
+    def clear_cache(self):
+        """
+        calculate_metrics sonuç önbelleğini temizler.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_chars = 0
     
     def split_into_sentences(self, text: str) -> list:
         """
@@ -22,8 +75,13 @@ class GEOMetrics:
         Returns:
             list: Cümle listesi
         """
+        # Hiç cümle sonu işareti yoksa metnin tamamı tek cümledir
+        if '.' not in text and '!' not in text and '?' not in text:
+            text = text.strip()
+            return [text] if text else []
+        
         # Basit cümle bölme (nokta, ünlem, soru işareti)
-        sentences = re.split('[.!?]', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
         # Boş cümleleri temizle
         return [s.strip() for s in sentences if s.strip()]
     
@@ -39,13 +97,36 @@ class GEOMetrics:
             list: [(kelime_sayısı, pozisyon)] formatında liste
         """
         positions = []
+        if not response_sentences:
+            return positions
+        
+        # Yanıt cümlelerini ayraçla tek bir küçük harfli metinde birleştir;
+        # her cümlenin başlangıç ofsetini sakla ('İ' gibi harfler küçültülünce
+        # uzunluk değişebildiği için ofsetler küçük harfli metinden hesaplanır)
+        lowered = [response.lower() for response in response_sentences]
+        starts = []
+        offset = 0
+        for response in lowered:
+            starts.append(offset)
+            offset += len(response) + 1
+        joined = '\x00'.join(lowered)
+        
+        # Döngü içinde tekrar tekrar çözülmesin diye metotları yerelde tut
+        find = joined.find
+        positions_append = positions.append
+        last = len(starts)
         for source in source_sentences:
-            source_words = len(source.split())
-            # Her kaynak cümle için yanıt metninde ara
-            for i, response in enumerate(response_sentences, 1):
-                if source.lower() in response.lower():
-                    positions.append((source_words, i))
+            # İlk eşleşme, kaynağı içeren ilk yanıt cümlesine karşılık gelir
+            source_lower = source.lower()
+            hit = find(source_lower)
+            while hit != -1:
+                position = bisect_right(starts, hit)
+                # Eşleşme ayracı aşıp sonraki cümleye taşıyorsa geçersizdir;
+                # aramaya sonraki cümlenin başından devam et
+                if position == last or hit + len(source_lower) < starts[position]:
+                    positions_append((len(source.split()), position))
                     break
+                hit = find(source_lower, starts[position])
         return positions
     
     def word_count_metric(self, source_words: int, total_words: int) -> float:
@@ -69,6 +150,7 @@ class GEOMetrics:
         
         Args:
             sentences (list): Her bir cümle için (kelime_sayısı, pozisyon) tuple'larından oluşan liste
+                ya da (N, 2) boyutlu NumPy dizisi
             total_words (int): Toplam yanıt kelime sayısı
             
         Returns:
@@ -76,13 +158,42 @@ class GEOMetrics:
         """
         if total_words == 0:
             return 0
+        
+        # Python listeleri için döngü daha hızlı: listeyi NumPy dizisine
+        # dönüştürmek, hesaplamanın kendisinden pahalıdır
+        if not isinstance(sentences, np.ndarray):
+            weighted_sum = 0
+            for word_count, position in sentences:
+                weight = math.exp(-position / self.lambda_decay)
+                weighted_sum += word_count * weight
             
-        weighted_sum = 0
-        for word_count, position in sentences:
-            weight = math.exp(-position / self.lambda_decay)
-            weighted_sum += word_count * weight
+            return weighted_sum / total_words
+        
+        if len(sentences) == 0:
+            return 0.0
+        
+        # (N, 2) dizisi: sütun 0 kelime sayısı, sütun 1 pozisyon
+        arr = np.asarray(sentences, dtype=np.float64)
+        return self._weighted_position_sum(arr[:, 0], arr[:, 1]) / total_words
+    
+    def _weighted_position_sum(self, words: np.ndarray, positions: np.ndarray) -> float:
+        """
+        sum(kelime_sayısı * exp(-pozisyon / lambda)) toplamını hesaplar.
+        
+        Args:
+            words (np.ndarray): Kelime sayıları
+            positions (np.ndarray): Pozisyonlar
             
-        return weighted_sum / total_words
+        Returns:
+            float: Ağırlıklı toplam
+        """
+        inv_lambda = 1.0 / self.lambda_decay
+        if words.shape[0] >= _KERNEL_MIN_LENGTH:
+            kernel = _get_pam_kernel()
+            if kernel is not None:
+                return float(kernel(words, positions, inv_lambda))
+        weights = np.exp(-positions * inv_lambda)
+        return float(words.dot(weights))
     
     def calculate_metrics(self, source_text: str, response_text: str) -> dict:
         """
@@ -95,6 +206,20 @@ class GEOMetrics:
         Returns:
             dict: Hesaplanan metrikler
         """
+        # Aynı metinler için önceki sonucu döndür (LRU; çok uzun metinler
+        # önbelleğe alınmaz)
+        text_chars = len(source_text) + len(response_text)
+        cacheable = text_chars <= _CACHE_MAX_CHARS
+        key = (source_text, response_text, self.lambda_decay)
+        if cacheable:
+            with self._cache_lock:
+                cached = self._cache.pop(key, None)
+                if cached is not None:
+                    # Kaydı sona taşı: en son kullanılan en son çıkarılır
+                    self._cache[key] = cached
+            if cached is not None:
+                return self._copy_result(cached)
+        
         # Metinleri cümlelere böl
         source_sentences = self.split_into_sentences(source_text)
         response_sentences = self.split_into_sentences(response_text)
@@ -110,11 +235,31 @@ class GEOMetrics:
         wc_metric = self.word_count_metric(source_words, total_words)
         pos_metric = self.position_adjusted_metric(sentence_positions, total_words)
         
-        return {
+        result = {
             "word_count_metric": wc_metric,
             "position_adjusted_metric": pos_metric,
             "source_positions": sentence_positions  # Debug için pozisyon bilgisi
         }
+        
+        if cacheable:
+            entry = self._copy_result(result)
+            with self._cache_lock:
+                # Başka bir iş parçacığı aynı sonucu eklemişse karakterler zaten sayılmıştır
+                if self._cache.pop(key, None) is None:
+                    self._cache_chars += text_chars
+                while self._cache and (self._cache_chars > _CACHE_MAX_CHARS
+                                       or len(self._cache) >= _CACHE_MAX_ENTRIES):
+                    # En uzun süredir kullanılmayan kaydı çıkar (dict sırası kullanım sırasıdır)
+                    old_key = next(iter(self._cache))
+                    del self._cache[old_key]
+                    self._cache_chars -= len(old_key[0]) + len(old_key[1])
+                self._cache[key] = entry
+        return result
+    
+    @staticmethod
+    def _copy_result(result: dict) -> dict:
+        # Çağıranın değiştirebileceği listeyi önbellekle paylaşma
+        return {**result, "source_positions": list(result["source_positions"])}
 
 # Örnek kullanım
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
+import sys
+import threading
 import unittest
+from unittest import mock
+import numpy as np
+import geo_metrics
 from geo_metrics import GEOMetrics
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 class TestGEOMetrics(unittest.TestCase):
-    def setUp(self):
-        self.geo = GEOMetrics(lambda_decay=10)
+    @classmethod
+    def setUpClass(cls):
+        cls.geo = GEOMetrics(lambda_decay=10)
     
     def test_word_count_metric(self):
         # Test 1: Basit durum
@@ -38,7 +49,79 @@ class TestGEOMetrics(unittest.TestCase):
             self.geo.position_adjusted_metric(sentences, 0),
             0
         )
+
+        # Test 3: Boş cümle listesi float döndürür
+        sonuc = self.geo.position_adjusted_metric([], 20)
+        self.assertIsInstance(sonuc, float)
+        self.assertEqual(sonuc, 0.0)
+
+        # Test 4: Üreteç ve NumPy dizisi girdileri
+        self.assertAlmostEqual(
+            self.geo.position_adjusted_metric(iter(sentences), 20),
+            0.45241870901797976,
+            places=7
+        )
+        self.assertAlmostEqual(
+            self.geo.position_adjusted_metric(np.array(sentences), 20),
+            0.45241870901797976,
+            places=7
+        )
     
+    def _kernel_karsilastir(self):
+        # Çekirdek yolunu her boyutta zorla ve liste yoluyla karşılaştır
+        sentences = [(10, 1), (4, 3), (7, 12)]
+        beklenen = self.geo.position_adjusted_metric(sentences, 40)
+        with mock.patch.object(geo_metrics, "_KERNEL_MIN_LENGTH", 1), \
+             mock.patch.object(geo_metrics, "_pam_kernel", None), \
+             mock.patch.object(geo_metrics, "_pam_kernel_loaded", False):
+            sonuc = self.geo.position_adjusted_metric(np.array(sentences), 40)
+            kernel = geo_metrics._pam_kernel
+        self.assertAlmostEqual(sonuc, beklenen, places=12)
+        return kernel
+
+    @unittest.skipIf(numba is None, "numba yüklü değil")
+    def test_position_adjusted_metric_numba(self):
+        self.assertIsNotNone(self._kernel_karsilastir())
+
+    def test_position_adjusted_metric_numba_yok(self):
+        # numba import edilemezse NumPy yoluna düşülmeli
+        with mock.patch.dict(sys.modules, {"numba": None}):
+            self.assertIsNone(self._kernel_karsilastir())
+
+    def test_split_into_sentences(self):
+        # Test 1: Nokta, ünlem ve soru işaretiyle bölme
+        self.assertEqual(
+            self.geo.split_into_sentences("Çiçekçi geldi. Şükrü güldü! Neden? "),
+            ["Çiçekçi geldi", "Şükrü güldü", "Neden"]
+        )
+
+        # Test 2: Ayraç olmayan karakterler cümleyi bölmez
+        self.assertEqual(self.geo.split_into_sentences("a\x00b. c"), ["a\x00b", "c"])
+        self.assertEqual(self.geo.split_into_sentences("  "), [])
+
+    def test_find_source_positions(self):
+        # Test 1: Farklı sıralama ve Türkçe büyük harfler
+        kaynak = ["İlk cümle budur", "Son cümle de budur"]
+        yanit = ["Son cümle de budur", "Ortada başka bir şey var", "İLK CÜMLE BUDUR"]
+        self.assertEqual(
+            self.geo.find_source_positions(kaynak, yanit),
+            [(3, 3), (4, 1)]
+        )
+
+        # Test 2: Eşleşmeyen cümle ve boş yanıt
+        self.assertEqual(self.geo.find_source_positions(["Yok"], yanit), [])
+        self.assertEqual(self.geo.find_source_positions(kaynak, []), [])
+
+        # Test 3: Eşleşme iki yanıt cümlesinin sınırını aşamaz
+        self.assertEqual(self.geo.find_source_positions(["b\x00c"], ["ab", "cd"]), [])
+        self.assertEqual(self.geo.find_source_positions(["b\x00c"], ["ab", "cd", "xb\x00cx"]), [(1, 3)])
+
+        # Test 4: Kaynağı içeren ilk cümle, sonraki birebir eşleşmeden önce gelir
+        self.assertEqual(
+            self.geo.find_source_positions(["Python harikadır"], ["Python harikadır ve hızlıdır", "Python harikadır"]),
+            [(2, 1)]
+        )
+
     def test_calculate_metrics(self):
         kaynak = "Bu test bir örnektir."
         yanit = "Bu test bir örnektir ve başka kelimeler de içerir."
@@ -50,5 +133,74 @@ class TestGEOMetrics(unittest.TestCase):
         self.assertTrue(0 <= sonuclar["word_count_metric"] <= 1)
         self.assertTrue(0 <= sonuclar["position_adjusted_metric"] <= 1)
 
+    def test_calculate_metrics_cache(self):
+        kaynak = "Python harikadır. Çok yetenekli bir dildir."
+        yanit = "Programlama önemlidir. Python harikadır. Çok yetenekli bir dildir."
+        self.geo.clear_cache()
+
+        with mock.patch.object(self.geo, "split_into_sentences",
+                               wraps=self.geo.split_into_sentences) as bolucu:
+            ilk = self.geo.calculate_metrics(kaynak, yanit)
+            self.assertEqual(bolucu.call_count, 2)
+            ilk["source_positions"].append((0, 0))
+
+            # İkinci çağrı önbellekten gelmeli ve çağıranın değişikliğinden etkilenmemeli
+            ikinci = self.geo.calculate_metrics(kaynak, yanit)
+            self.assertEqual(bolucu.call_count, 2)
+            self.assertEqual(ikinci["source_positions"], [(2, 2), (4, 3)])
+
+            # Önbellek temizlenince yeniden hesaplanmalı
+            self.geo.clear_cache()
+            self.assertEqual(self.geo.calculate_metrics(kaynak, yanit), ikinci)
+            self.assertEqual(bolucu.call_count, 4)
+
+    def test_calculate_metrics_cache_limit(self):
+        geo = GEOMetrics(lambda_decay=10)
+
+        # Her kayıt 4 karakter tutar; sınır 10 karakter olduğunda en fazla iki kayıt kalır
+        with mock.patch("geo_metrics._CACHE_MAX_CHARS", 10):
+            geo.calculate_metrics("a.", "a.")
+            geo.calculate_metrics("b.", "b.")
+            geo.calculate_metrics("a.", "a.")  # "a." en son kullanılan olur
+            geo.calculate_metrics("c.", "c.")  # en uzun süredir kullanılmayan "b." çıkar
+
+            # Sınırı tek başına aşan metinler önbelleğe alınmaz
+            geo.calculate_metrics("uzun bir kaynak.", "uzun bir yanıt.")
+
+        self.assertEqual([anahtar[0] for anahtar in geo._cache], ["a.", "c."])
+        self.assertEqual(geo._cache_chars, 8)
+
+    def test_calculate_metrics_cache_threads(self):
+        geo = GEOMetrics(lambda_decay=10)
+        metinler = [(f"Kaynak {i}.", f"Yanıt {i}. Kaynak {i}.") for i in range(40)]
+        hatalar = []
+
+        def calistir():
+            try:
+                for _ in range(100):
+                    for kaynak, yanit in metinler:
+                        geo.calculate_metrics(kaynak, yanit)
+            except Exception as hata:  # iş parçacığı hatalarını ana teste taşı
+                hatalar.append(hata)
+
+        eski_aralik = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with mock.patch.object(geo_metrics, "_CACHE_MAX_ENTRIES", 4):
+                is_parcaciklari = [threading.Thread(target=calistir) for _ in range(8)]
+                for t in is_parcaciklari:
+                    t.start()
+                for t in is_parcaciklari:
+                    t.join()
+        finally:
+            sys.setswitchinterval(eski_aralik)
+
+        self.assertEqual(hatalar, [])
+        self.assertLessEqual(len(geo._cache), 4)
+        self.assertEqual(
+            geo._cache_chars,
+            sum(len(kaynak) + len(yanit) for kaynak, yanit, _ in geo._cache)
+        )
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
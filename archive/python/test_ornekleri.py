@@ -1,45 +1,63 @@
+import unittest
 from geo_metrics import GEOMetrics
 
-def test_yazdir(senaryo_no, kaynak, yanit):
-    print(f"\n=== Senaryo {senaryo_no} ===")
-    print(f"Kaynak: {kaynak}")
-    print(f"Yanıt: {yanit}")
-    
-    geo = GEOMetrics(lambda_decay=10)
-    sonuclar = geo.calculate_metrics(kaynak, yanit)
-    
-    print("\nSonuçlar:")
-    print(f"Kelime Sayısı Metriği: {sonuclar['word_count_metric']:.3f}")
-    print(f"Konum Ağırlıklı Metrik: {sonuclar['position_adjusted_metric']:.3f}")
-    print(f"Kaynak Pozisyonları: {sonuclar['source_positions']}")
+# Tüm senaryolar için tek bir örnek kullanılır
+geo = GEOMetrics(lambda_decay=10)
+
+# Test Senaryoları: (açıklama, kaynak, yanıt, beklenen kaynak pozisyonları)
+SENARYOLAR = [
+    # Senaryo 1: Basit eşleşme
+    ("Basit eşleşme",
+     "Python programlama dili çok kullanışlıdır.",
+     "Python programlama dili çok kullanışlıdır. Ayrıca öğrenmesi de kolaydır.",
+     [(5, 1)]),
+    # Senaryo 2: Çoklu cümle
+    ("Çoklu cümle",
+     "Python harikadır. Çok yetenekli bir dildir.",
+     "Programlama önemlidir. Python harikadır. Başka diller de var. Çok yetenekli bir dildir.",
+     [(2, 2), (4, 4)]),
+    # Senaryo 3: Kısmi eşleşme
+    ("Kısmi eşleşme",
+     "Yapay zeka çok önemlidir. Gelecekte her yerde olacak.",
+     "Yapay zeka çok önemlidir. Teknoloji gelişiyor. Gelecekte farklı şeyler olacak.",
+     [(4, 1)]),
+    # Senaryo 4: Farklı sıralama
+    ("Farklı sıralama",
+     "İlk cümle budur. Son cümle de budur.",
+     "Son cümle de budur. Ortada başka bir şey var. İlk cümle budur.",
+     [(3, 3), (4, 1)]),
+    # Senaryo 5: Türkçe karakterler
+    ("Türkçe karakterler",
+     "Şükrü Şükrü'ye şükür etti. Çiçekçi çiçekleri çok sevdi.",
+     "Şükrü Şükrü'ye şükür etti. Başka bir şey oldu. Çiçekçi çiçekleri çok sevdi.",
+     [(4, 1), (4, 3)]),
+]
 
-# Test Senaryoları
-# Senaryo 1: Basit eşleşme
-test_yazdir(1,
-    "Python programlama dili çok kullanışlıdır.",
-    "Python programlama dili çok kullanışlıdır. Ayrıca öğrenmesi de kolaydır."
-)
+def sonuclari_yazdir(senaryo_no, kaynak, yanit):
+    sonuclar = geo.calculate_metrics(kaynak, yanit)
 
-# Senaryo 2: Çoklu cümle
-test_yazdir(2,
-    "Python harikadır. Çok yetenekli bir dildir.",
-    "Programlama önemlidir. Python harikadır. Başka diller de var. Çok yetenekli bir dildir."
-)
+    # Satırları topla, senaryo başına tek seferde yazdır
+    satirlar = [
+        f"\n=== Senaryo {senaryo_no} ===",
+        f"Kaynak: {kaynak}",
+        f"Yanıt: {yanit}",
+        "\nSonuçlar:",
+        f"Kelime Sayısı Metriği: {sonuclar['word_count_metric']:.3f}",
+        f"Konum Ağırlıklı Metrik: {sonuclar['position_adjusted_metric']:.3f}",
+        f"Kaynak Pozisyonları: {sonuclar['source_positions']}",
+    ]
+    print("\n".join(satirlar))
 
-# Senaryo 3: Kısmi eşleşme
-test_yazdir(3,
-    "Yapay zeka çok önemlidir. Gelecekte her yerde olacak.",
-    "Yapay zeka çok önemlidir. Teknoloji gelişiyor. Gelecekte farklı şeyler olacak."
-)
+class TestOrnekSenaryolar(unittest.TestCase):
+    def test_senaryolar(self):
+        for aciklama, kaynak, yanit, beklenen in SENARYOLAR:
+            with self.subTest(aciklama):
+                sonuclar = geo.calculate_metrics(kaynak, yanit)
 
-# Senaryo 4: Farklı sıralama
-test_yazdir(4,
-    "İlk cümle budur. Son cümle de budur.",
-    "Son cümle de budur. Ortada başka bir şey var. İlk cümle budur."
-)
+                self.assertEqual(sonuclar["source_positions"], beklenen)
+                self.assertTrue(0 <= sonuclar["word_count_metric"] <= 1)
+                self.assertTrue(0 <= sonuclar["position_adjusted_metric"] <= 1)
 
-# Senaryo 5: Türkçe karakterler
-test_yazdir(5,
-    "Şükrü Şükrü'ye şükür etti. Çiçekçi çiçekleri çok sevdi.",
-    "Şükrü Şükrü'ye şükür etti. Başka bir şey oldu. Çiçekçi çiçekleri çok sevdi."
-) 
\ No newline at end of file
+if __name__ == "__main__":
+    for senaryo_no, (_, kaynak, yanit, _) in enumerate(SENARYOLAR, 1):
+        sonuclari_yazdir(senaryo_no, kaynak, yanit)